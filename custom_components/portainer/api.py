@@ -2,6 +2,7 @@
 
 from logging import getLogger
 from threading import Lock
+from time import monotonic
 from typing import Any
 
 from requests import get as requests_get, post as requests_post
@@ -9,6 +10,11 @@ from voluptuous import Optional
 
 from homeassistant.core import HomeAssistant
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 _LOGGER = getLogger(__name__)
 
 
@@ -40,6 +46,7 @@ class PortainerAPI(object):
         self.lock = Lock()
         self._connected = False
         self._error = ""
+        self._blackout = 0.0
 
     # ---------------------------
     #   connected
@@ -65,6 +72,11 @@ class PortainerAPI(object):
     ) -> Optional(list):
         """Retrieve data from Portainer."""
         self.lock.acquire()
+        if self._rate_limited(service):
+            self.lock.release()
+            return None
+
+        response = None
         error = False
         try:
             _LOGGER.debug(
@@ -98,7 +110,7 @@ class PortainerAPI(object):
                 )
 
             if response.status_code == 200:
-                data = response.json()
+                data = json_loads(response.content)
                 _LOGGER.debug("Portainer %s query response: %s", self._host, data)
             else:
                 error = True
@@ -106,10 +118,10 @@ class PortainerAPI(object):
             error = True
 
         if error:
-            try:
-                errorcode = response.status_code
-            except Exception:
-                errorcode = "no_response"
+            errorcode = (
+                response.status_code if response is not None else "no_response"
+            )
+            self._set_backoff(response)
 
             _LOGGER.warning(
                 'Portainer %s unable to fetch data "%s" (%s)',
@@ -131,6 +143,35 @@ class PortainerAPI(object):
 
         return data
 
+    # ---------------------------
+    #   _rate_limited
+    # ---------------------------
+    def _rate_limited(self, service: str) -> bool:
+        """Return True while Portainer asked to back off."""
+        if self._blackout <= monotonic():
+            return False
+
+        _LOGGER.debug(
+            "Portainer %s rate limited, skipping query: %s", self._host, service
+        )
+        self._error = 429
+        return True
+
+    # ---------------------------
+    #   _set_backoff
+    # ---------------------------
+    def _set_backoff(self, response) -> None:
+        """Back off queries for the Retry-After period of a 429 response."""
+        if response is None or response.status_code != 429:
+            return
+
+        try:
+            retry_after = int(response.headers.get("Retry-After", "60"))
+        except ValueError:
+            retry_after = 60
+
+        self._blackout = monotonic() + retry_after
+
     @property
     def error(self):
         """Return error."""
@@ -12,6 +12,7 @@ DEFAULT_NAME = "root"
 ATTRIBUTION = "Data provided by Portainer integration"
 
 SCAN_INTERVAL = 30
+UPDATE_COOLDOWN = 2.0
 
 DEFAULT_HOST = "10.0.0.1"
 
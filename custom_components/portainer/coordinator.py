@@ -152,6 +152,9 @@ class PortainerCoordinator(DataUpdateCoordinator):
     #   get_containers
     # ---------------------------
     def get_containers(self) -> None:
+        """Get containers."""
+        health_check = self.features[CONF_FEATURE_HEALTH_CHECK]
+        restart_policy = self.features[CONF_FEATURE_RESTART_POLICY]
         self.data["containers"] = {}
         for eid in self.data["endpoints"]:
             self.data["containers"] = parse_api(
@@ -201,10 +204,7 @@ class PortainerCoordinator(DataUpdateCoordinator):
                     "Names"
                 ][0][1:]
             # only if some custom feature is enabled
-            if (
-                self.features[CONF_FEATURE_HEALTH_CHECK]
-                or self.features[CONF_FEATURE_RESTART_POLICY]
-            ):
+            if health_check or restart_policy:
                 for cid in self.data["containers"]:
                     self.data["containers"][cid][CUSTOM_ATTRIBUTE_ARRAY + "_Raw"] = (
                         parse_api(
@@ -232,7 +232,7 @@ class PortainerCoordinator(DataUpdateCoordinator):
                             ],
                         )
                     )
-                    if self.features[CONF_FEATURE_HEALTH_CHECK]:
+                    if health_check:
                         self.data["containers"][cid][CUSTOM_ATTRIBUTE_ARRAY][
                             "Health_Status"
                         ] = self.data["containers"][cid][
@@ -240,7 +240,7 @@ class PortainerCoordinator(DataUpdateCoordinator):
                         ][
                             "Health_Status"
                         ]
-                    if self.features[CONF_FEATURE_RESTART_POLICY]:
+                    if restart_policy:
                         self.data["containers"][cid][CUSTOM_ATTRIBUTE_ARRAY][
                             "Restart_Policy"
                         ] = self.data["containers"][cid][
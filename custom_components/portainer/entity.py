@@ -13,6 +13,7 @@ from homeassistant.helpers import (
     entity_platform as ep,
     entity_registry as er,
 )
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.dispatcher import (
     async_dispatcher_connect,
 )
@@ -20,13 +21,103 @@ from homeassistant.helpers.entity import DeviceInfo, Entity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import slugify
 
-from .const import ATTRIBUTION, DOMAIN, CUSTOM_ATTRIBUTE_ARRAY
+from .const import ATTRIBUTION, DOMAIN, CUSTOM_ATTRIBUTE_ARRAY, UPDATE_COOLDOWN
 from .coordinator import PortainerCoordinator
 from .helper import format_attribute
 
 _LOGGER = getLogger(__name__)
 
 
+# ---------------------------
+#   format_unique_id
+# ---------------------------
+def format_unique_id(inst: str, description, data: dict | None = None) -> str:
+    """Return the unique id for an entity."""
+    if data is None:
+        return f"{inst.lower()}-{description.key}"
+
+    return f"{inst.lower()}-{description.key}-{slugify(str(data[description.data_reference]).lower())}"
+
+
+# ---------------------------
+#   _entities_signature
+# ---------------------------
+def _entities_signature(coordinator: PortainerCoordinator, descriptions) -> tuple:
+    """Return the values entity unique ids are built from."""
+    signature = []
+    for description in descriptions:
+        data = coordinator.data[description.data_path]
+        if not description.data_reference:
+            signature.append(data.get(description.data_attribute) is not None)
+        else:
+            signature.append(
+                frozenset(
+                    str(item[description.data_reference]) for item in data.values()
+                )
+            )
+
+    return tuple(signature)
+
+
+# ---------------------------
+#   _needs_adding
+# ---------------------------
+def _needs_adding(entity_registry, platform, loaded_ids: set, unique_id: str) -> bool:
+    """Check whether entity is missing from the platform."""
+    if unique_id in loaded_ids:
+        return False
+
+    entity_id = entity_registry.async_get_entity_id(platform.domain, DOMAIN, unique_id)
+    entity = entity_registry.async_get(entity_id)
+    if entity is None or (
+        (entity_id not in platform.entities) and (entity.disabled is False)
+    ):
+        _LOGGER.debug("Add entity %s", entity_id)
+        loaded_ids.add(unique_id)
+        return True
+
+    return False
+
+
+# ---------------------------
+#   _missing_entities
+# ---------------------------
+def _missing_entities(
+    hass: HomeAssistant,
+    platform,
+    coordinator: PortainerCoordinator,
+    sensor_classes: tuple,
+    loaded_ids: set,
+) -> list:
+    """Create entities missing from the platform."""
+    entity_registry = er.async_get(hass)
+    inst = coordinator.config_entry.data[CONF_NAME]
+    new_entities = []
+    for description, sensor_class in sensor_classes:
+        data = coordinator.data[description.data_path]
+        if not description.data_reference:
+            if data.get(description.data_attribute) is None:
+                continue
+            if _needs_adding(
+                entity_registry,
+                platform,
+                loaded_ids,
+                format_unique_id(inst, description),
+            ):
+                new_entities.append(sensor_class(coordinator, description))
+        else:
+            for uid in data:
+                if _needs_adding(
+                    entity_registry,
+                    platform,
+                    loaded_ids,
+                    format_unique_id(inst, description, data[uid]),
+                ):
+                    new_entities.append(sensor_class(coordinator, description, uid))
+
+    return new_entities
+
+
 # ---------------------------
 #   async_add_entities
 # ---------------------------
@@ -42,43 +133,44 @@ async def async_add_entities(
     for service in services:
         platform.async_register_entity_service(service[0], service[1], service[2])
 
+    sensor_classes = tuple(
+        (description, dispatcher[description.func]) for description in descriptions
+    )
+    last_signature = None
+
+    async def async_update_entities():
+        """Add entities missing from the platform."""
+        nonlocal last_signature
+        signature = _entities_signature(coordinator, descriptions)
+        if signature == last_signature:
+            return
+
+        last_signature = signature
+        loaded_ids = {entity.unique_id for entity in platform.entities.values()}
+        new_entities = _missing_entities(
+            hass, platform, coordinator, sensor_classes, loaded_ids
+        )
+        if new_entities:
+            await platform.async_add_entities(new_entities)
+
+    debouncer = Debouncer(
+        hass,
+        _LOGGER,
+        cooldown=UPDATE_COOLDOWN,
+        immediate=True,
+        function=async_update_entities,
+    )
+
     @callback
-    async def async_update_controller(coordinator):
+    async def async_update_controller(updated_coordinator):
         """Update the values of the controller."""
+        if updated_coordinator is coordinator:
+            await debouncer.async_call()
 
-        async def async_check_exist(obj, coordinator, uid: None) -> None:
-            """Check entity exists."""
-            entity_registry = er.async_get(hass)
-            if uid:
-                unique_id = f"{obj._inst.lower()}-{obj.description.key}-{slugify(str(obj._data[obj.description.data_reference]).lower())}"
-            else:
-                unique_id = f"{obj._inst.lower()}-{obj.description.key}"
-
-            entity_id = entity_registry.async_get_entity_id(
-                platform.domain, DOMAIN, unique_id
-            )
-            entity = entity_registry.async_get(entity_id)
-            if entity is None or (
-                (entity_id not in platform.entities) and (entity.disabled is False)
-            ):
-                _LOGGER.debug("Add entity %s", entity_id)
-                await platform.async_add_entities([obj])
-
-        for description in descriptions:
-            data = coordinator.data[description.data_path]
-            if not description.data_reference:
-                if data.get(description.data_attribute) is None:
-                    continue
-                obj = dispatcher[description.func](coordinator, description)
-                await async_check_exist(obj, coordinator, None)
-            else:
-                for uid in data:
-                    obj = dispatcher[description.func](coordinator, description, uid)
-                    await async_check_exist(obj, coordinator, uid)
-
-    await async_update_controller(coordinator)
+    await async_update_entities()
     unsub = async_dispatcher_connect(hass, "update_sensors", async_update_controller)
     config_entry.async_on_unload(unsub)
+    config_entry.async_on_unload(debouncer.async_cancel)
 
 
 # ---------------------------
@@ -88,6 +180,7 @@ class PortainerEntity(CoordinatorEntity[PortainerCoordinator], Entity):
     """Define entity."""
 
     _attr_has_entity_name = True
+    sw_version = ""
 
     def __init__(
         self,
@@ -98,9 +191,9 @@ class PortainerEntity(CoordinatorEntity[PortainerCoordinator], Entity):
         """Initialize entity."""
         super().__init__(coordinator)
         self.manufacturer = "Docker"
-        self.sw_version = ""
         self.coordinator = coordinator
         self.description = description
+        self.ha_group = description.ha_group
         self._inst = coordinator.config_entry.data[CONF_NAME]
         self._attr_extra_state_attributes = {ATTR_ATTRIBUTION: ATTRIBUTION}
         self._uid = uid
@@ -130,9 +223,9 @@ class PortainerEntity(CoordinatorEntity[PortainerCoordinator], Entity):
     def unique_id(self) -> str:
         """Return a unique id for this entity."""
         if self._uid:
-            return f"{self._inst.lower()}-{self.description.key}-{slugify(str(self._data[self.description.data_reference]).lower())}"
-        else:
-            return f"{self._inst.lower()}-{self.description.key}"
+            return format_unique_id(self._inst, self.description, self._data)
+
+        return format_unique_id(self._inst, self.description)
 
     @property
     def available(self) -> bool:
@@ -143,10 +236,10 @@ class PortainerEntity(CoordinatorEntity[PortainerCoordinator], Entity):
     def device_info(self) -> DeviceInfo:
         """Return a description for device registry."""
         dev_connection = DOMAIN
-        dev_connection_value = f"{self.coordinator.name}_{self.description.ha_group}"
-        dev_group = self.description.ha_group
-        if self.description.ha_group.startswith("data__"):
-            dev_group = self.description.ha_group[6:]
+        dev_connection_value = f"{self.coordinator.name}_{self.ha_group}"
+        dev_group = self.ha_group
+        if self.ha_group.startswith("data__"):
+            dev_group = self.ha_group[6:]
             if dev_group in self._data:
                 dev_group = self._data[dev_group]
                 dev_connection_value = dev_group
@@ -160,7 +253,7 @@ class PortainerEntity(CoordinatorEntity[PortainerCoordinator], Entity):
                 dev_connection_value = dev_connection_value[6:]
                 dev_connection_value = self._data[dev_connection_value]
 
-        if self.description.ha_group == "System":
+        if self.ha_group == "System":
             return DeviceInfo(
                 connections={(dev_connection, f"{dev_connection_value}")},
                 identifiers={(dev_connection, f"{dev_connection_value}")},
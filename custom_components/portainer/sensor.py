@@ -28,12 +28,7 @@ async def async_setup_entry(
     _async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up entry for portainer component."""
-    dispatcher = {
-        "PortainerSensor": PortainerSensor,
-        "EndpointSensor": EndpointSensor,
-        "ContainerSensor": ContainerSensor,
-    }
-    await async_add_entities(hass, config_entry, dispatcher)
+    await async_add_entities(hass, config_entry, SENSOR_DISPATCHER)
 
 
 # ---------------------------
@@ -52,22 +47,24 @@ class PortainerSensor(PortainerEntity, SensorEntity):
         self._attr_suggested_unit_of_measurement = (
             self.description.suggested_unit_of_measurement
         )
+        self._data_attribute = self.description.data_attribute
+        self._uom_key = None
+        self._uom_static = self.description.native_unit_of_measurement
+        if self._uom_static and self._uom_static.startswith("data__"):
+            self._uom_key = self._uom_static[6:]
 
     @property
     def native_value(self) -> StateType | date | datetime | Decimal:
         """Return the value reported by the sensor."""
-        return self._data[self.description.data_attribute]
+        return self._data[self._data_attribute]
 
     @property
     def native_unit_of_measurement(self) -> str | None:
         """Return the unit the value is expressed in."""
-        if self.description.native_unit_of_measurement:
-            if self.description.native_unit_of_measurement.startswith("data__"):
-                uom = self.description.native_unit_of_measurement[6:]
-                if uom in self._data:
-                    return self._data[uom]
+        if self._uom_key:
+            return self._data.get(self._uom_key, self._uom_static)
 
-            return self.description.native_unit_of_measurement
+        return self._uom_static or None
 
 
 # ---------------------------
@@ -99,15 +96,24 @@ class ContainerSensor(PortainerSensor):
         uid: str | None = None,
     ):
         super().__init__(coordinator, description, uid)
-        self.sw_version = self.coordinator.data["endpoints"][self._data["EndpointId"]][
-            "DockerVersion"
-        ]
-        if self.description.ha_group.startswith("data__"):
-            dev_group = self.description.ha_group[6:]
-            if (
-                dev_group in self._data
-                and self._data[dev_group] in self.coordinator.data["endpoints"]
-            ):
-                self.description.ha_group = self.coordinator.data["endpoints"][
-                    self._data[dev_group]
-                ]["Name"]
+        endpoints = self.coordinator.data["endpoints"]
+        if self.ha_group.startswith("data__"):
+            dev_group = self.ha_group[6:]
+            if dev_group in self._data and self._data[dev_group] in endpoints:
+                self.ha_group = endpoints[self._data[dev_group]]["Name"]
+
+    @property
+    def sw_version(self) -> str:
+        """Return the Docker version of the container endpoint."""
+        endpoint = self.coordinator.data["endpoints"].get(self._data["EndpointId"])
+        return endpoint["DockerVersion"] if endpoint else ""
+
+
+# ---------------------------
+#   SENSOR_DISPATCHER
+# ---------------------------
+SENSOR_DISPATCHER = {
+    "PortainerSensor": PortainerSensor,
+    "EndpointSensor": EndpointSensor,
+    "ContainerSensor": ContainerSensor,
+}
@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import List
+from dataclasses import dataclass
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -14,7 +13,7 @@ from homeassistant.components.sensor import (
 from .const import CUSTOM_ATTRIBUTE_ARRAY
 
 
-DEVICE_ATTRIBUTES_ENDPOINTS = [
+DEVICE_ATTRIBUTES_ENDPOINTS = (
     "Type",
     "Status",
     "DockerVersion",
@@ -29,9 +28,9 @@ DEVICE_ATTRIBUTES_ENDPOINTS = [
     "ImageCount",
     "ServiceCount",
     "StackCount",
-]
+)
 
-DEVICE_ATTRIBUTES_CONTAINERS = [
+DEVICE_ATTRIBUTES_CONTAINERS = (
     "Image",
     "Network",
     "Compose_Stack",
@@ -40,7 +39,7 @@ DEVICE_ATTRIBUTES_CONTAINERS = [
     "Environment",
     # add all attributes form CUSTOM_ATTRIBUTE_ARRAY
     CUSTOM_ATTRIBUTE_ARRAY,
-]
+)
 
 
 @dataclass
@@ -55,7 +54,7 @@ class PortainerSensorEntityDescription(SensorEntityDescription):
     data_name: str | None = None
     data_uid: str | None = None
     data_reference: str | None = None
-    data_attributes_list: List = field(default_factory=lambda: [])
+    data_attributes_list: tuple[str, ...] = ()
     func: str = "PortainerSensor"
 
 